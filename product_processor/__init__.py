@@ -0,0 +1,33 @@
+"""
+Product Processor
+
+Public functions are re-exported here lazily (PEP 562): the submodule that
+defines a name is only imported the first time the name is accessed, so
+importing the package does not pull in the HTTP or HTML parsing stack.
+"""
+from __future__ import annotations
+
+# Maps each public name to the module that defines it
+_LAZY = {
+    "load_json_files": "product_processor.json_utils.loader",
+    "generate_csv": "product_processor.csv_utils.generator",
+    "download_product_images": "product_processor.image_utils.downloader",
+    "ProductScraper": "product_processor.scraper.scraper",
+    "scrape_products_from_website": "product_processor.scraper.scraper",
+}
+
+__all__ = list(_LAZY)
+
+def __getattr__(name: str) -> object:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,8 @@
+"""
+Entry point for ``python -m product_processor``.
+"""
+import sys
+
+from product_processor.main import main
+
+sys.exit(main())
@@ -5,10 +5,20 @@ This module provides functionality to generate CSV files from product data.
 """
 import csv
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Output buffer size; large enough that the writer issues few write() syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Common weights that get a price column pair, and the product keys for each pair
+_WEIGHTS = ("gram", "eighth_ounce", "quarter_ounce", "half_ounce", "ounce")
+_PRICE_KEYS = tuple((f"price_{w}", f"discounted_price_{w}") for w in _WEIGHTS)
+
+# Maps spaces to hyphens when building product link slugs
+_SLUG_TR = str.maketrans(" ", "-")
+
 def generate_csv(products: List[Dict[str, Any]], output_file: str = "products.csv") -> str:
     """
     Generate a CSV file from the product data.
@@ -30,9 +40,8 @@ def generate_csv(products: List[Dict[str, Any]], output_file: str = "products.cs
     
     try:
         # Determine maximum number of images to create columns
-        max_images = 0
-        for p in products:
-            max_images = max(max_images, len(p.get("image_urls", [])))
+        image_url_lists = [p.get("image_urls") or [] for p in products]
+        max_images = max(map(len, image_url_lists), default=0)
         
         logger.info(f"Maximum number of images per product: {max_images}")
         
@@ -43,10 +52,9 @@ def generate_csv(products: List[Dict[str, Any]], output_file: str = "products.cs
             "aggregate_rating", "review_count"
         ]
         
-        # Add price columns dynamically based on common weights
-        weights_keys = ["gram", "eighth_ounce", "quarter_ounce", "half_ounce", "ounce"]
-        for w in weights_keys:
-            csv_fields.extend([f"price_{w}", f"discounted_price_{w}"])
+        # Add price columns based on common weights
+        for orig_key, disc_key in _PRICE_KEYS:
+            csv_fields.extend([orig_key, disc_key])
         
         # Add image columns
         for i in range(1, max_images + 1):
@@ -54,71 +62,64 @@ def generate_csv(products: List[Dict[str, Any]], output_file: str = "products.cs
         
         csv_fields.extend(["tags", "product_link"])
         
-        csv_rows = []
-        
-        for p in products:
+        def _row(p: Dict[str, Any], image_urls: List[str]) -> Tuple[Any, ...]:
             # Weight options
-            weight_options = " - ".join([w.title() for w in p.get("available_weights", [])])
+            weight_options = " - ".join([w.title() for w in p.get("available_weights") or ()])
             
             # THC percent: pick first potency from inventory_potencies
             thc_percent = ""
             if p.get("inventory_potencies"):
                 thc_percent = str(p["inventory_potencies"][0].get("thc_potency", "")) + "%"
             
-            # Prices
-            row_prices = {}
-            for w in weights_keys:
-                orig_key = f"price_{w}"
-                disc_key = f"discounted_price_{w}"
-                row_prices[orig_key] = f"${p.get(orig_key, '')}" if p.get(orig_key) else ""
-                row_prices[disc_key] = f"${p.get(disc_key, '')}" if p.get(disc_key) else ""
+            # Prices, as (price, discounted price) pairs in _WEIGHTS order
+            row_prices = []
+            for orig_key, disc_key in _PRICE_KEYS:
+                orig = p.get(orig_key)
+                disc = p.get(disc_key)
+                row_prices.append(f"${orig}" if orig else "")
+                row_prices.append(f"${disc}" if disc else "")
             
-            # Images
-            image_urls = p.get("image_urls", [])
-            image_cols = {}
-            for i in range(max_images):
-                col_name = f"image_{i + 1}"
-                image_cols[col_name] = image_urls[i] if i < len(image_urls) else ""
+            # Images, padded with empty cells up to max_images
+            image_cells = image_urls[:max_images] + [""] * (max_images - len(image_urls))
             
             # Tags from brand specials
-            tags = []
-            if p.get("brand_special_prices"):
-                for sp in p["brand_special_prices"].values():
-                    if sp and sp.get("discount_label"):
-                        tags.append(sp["discount_label"])
-            tags_str = ", ".join(tags)
+            specials = p.get("brand_special_prices")
+            tags_str = ", ".join([
+                sp["discount_label"] for sp in specials.values()
+                if sp and sp.get("discount_label")
+            ]) if specials else ""
             
             # Product link
-            product_link = f"/shop/menu/products/{p.get('product_id')}/{p.get('brand', '').replace(' ', '-').lower()}-{p.get('name', '').replace(' ', '-').lower()}"
-            
-            # Combine everything
-            row = {
-                "brand": p.get("brand", ""),
-                "name": p.get("name", ""),
-                "description": p.get("description", ""),
-                "type": p.get("type", ""),
-                "category": p.get("category", ""),
-                "weight_options": weight_options,
-                "THC_percent": thc_percent,
-                "available_for_pickup": p.get("available_for_pickup", ""),
-                "available_for_delivery": p.get("available_for_delivery", ""),
-                "aggregate_rating": p.get("aggregate_rating", ""),
-                "review_count": p.get("review_count", ""),
-                **row_prices,
-                **image_cols,
-                "tags": tags_str,
-                "product_link": product_link
-            }
+            brand_slug = p.get("brand", "").lower().translate(_SLUG_TR)
+            name_slug = p.get("name", "").lower().translate(_SLUG_TR)
+            product_link = f"/shop/menu/products/{p.get('product_id')}/{brand_slug}-{name_slug}"
             
-            csv_rows.append(row)
+            # Combine everything, in csv_fields order
+            return (
+                p.get("brand", ""),
+                p.get("name", ""),
+                p.get("description", ""),
+                p.get("type", ""),
+                p.get("category", ""),
+                weight_options,
+                thc_percent,
+                p.get("available_for_pickup", ""),
+                p.get("available_for_delivery", ""),
+                p.get("aggregate_rating", ""),
+                p.get("review_count", ""),
+                *row_prices,
+                *image_cells,
+                tags_str,
+                product_link
+            )
         
-        # Write CSV
-        with open(output_file, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=csv_fields)
-            writer.writeheader()
-            writer.writerows(csv_rows)
+        # Write CSV, building rows lazily so only one is held in memory at a time
+        with open(output_file, "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(csv_fields)
+            writer.writerows(_row(p, urls) for p, urls in zip(products, image_url_lists))
         
-        logger.info(f"CSV generated with {len(csv_rows)} products: {output_file}")
+        logger.info(f"CSV generated with {len(products)} products: {output_file}")
         return output_file
         
     except Exception as e:
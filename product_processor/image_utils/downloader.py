@@ -4,42 +4,88 @@ Image Downloader Module
 This module provides functionality to download images from URLs.
 """
 import os
+import asyncio
 import logging
-import requests
+import aiohttp
+import aiofiles
 from typing import List, Dict, Any, Tuple
-from concurrent.futures import ThreadPoolExecutor
-from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
-def download_image(url: str, output_dir: str, product_id: str = None, index: int = 0) -> Tuple[str, str]:
+# Statuses that are retried with exponential backoff before giving up
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.5
+
+_CHUNK_SIZE = 65536
+# Network chunks are coalesced so that each disk write is at least this large
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Number of downloads between INFO-level progress messages
+_PROGRESS_INTERVAL = 100
+
+def _url_basename(url: str) -> str:
+    """
+    Get the last path segment of a URL.
+    
+    Equivalent to os.path.basename(urlparse(url).path) for the http(s) URLs
+    seen here, but uses a few string splits instead of the full URL parser.
+    
+    Args:
+        url (str): URL to take the basename of
+        
+    Returns:
+        str: Last path segment, or an empty string if the URL has no path
+    """
+    path = url.split('#', 1)[0].split('?', 1)[0]
+    if '://' in path or path.startswith('//'):
+        # Drop the scheme and network location
+        path = path.split('//', 1)[1].partition('/')[2]
+    return path.rsplit('/', 1)[-1].split(';', 1)[0]
+
+def create_session(pool_size: int = 10) -> aiohttp.ClientSession:
+    """
+    Create an HTTP session with connection pooling.
+    
+    Reusing one session keeps connections alive between downloads, so the
+    TCP and TLS handshakes are paid once per host instead of once per image.
+    Must be called from within a running event loop.
+    
+    Args:
+        pool_size (int, optional): Maximum number of simultaneous connections
+        
+    Returns:
+        aiohttp.ClientSession: Configured HTTP session
+    """
+    connector = aiohttp.TCPConnector(limit=pool_size)
+    # Limit connecting and each gap between reads, not the whole transfer, so
+    # large images on slow links can still complete
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=30)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+async def download_image(session: aiohttp.ClientSession, url: str, output_dir: str,
+                         product_id: str = None, index: int = 0) -> Tuple[str, str]:
     """
     Download an image from a URL and save it to the output directory.
     
     Args:
+        session (aiohttp.ClientSession): HTTP session to download with
         url (str): URL of the image to download
-        output_dir (str): Directory to save the image to
+        output_dir (str): Directory to save the image to (must already exist)
         product_id (str, optional): ID of the product the image belongs to
         index (int, optional): Index of the image in the product's image list
         
     Returns:
-        Tuple[str, str]: Tuple containing the original URL and the local path to the downloaded image
-        
-    Raises:
-        requests.RequestException: If there's an error downloading the image
-        IOError: If there's an error saving the image
+        Tuple[str, str]: Tuple containing the original URL and the local path to the
+        downloaded image (empty if the download failed)
     """
     if not url:
         logger.warning("Empty URL provided, skipping download")
         return url, ""
     
     try:
-        # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Parse URL to get filename
-        parsed_url = urlparse(url)
-        filename = os.path.basename(parsed_url.path)
+        # Take the last path segment of the URL as the filename
+        filename = _url_basename(url)
         
         # If filename is empty or doesn't have an extension, create a default one
         if not filename or '.' not in filename:
@@ -51,26 +97,77 @@ def download_image(url: str, output_dir: str, product_id: str = None, index: int
         
         output_path = os.path.join(output_dir, filename)
         
-        # Download the image
-        logger.info(f"Downloading image from {url} to {output_path}")
-        response = requests.get(url, stream=True, timeout=30)
-        response.raise_for_status()
-        
-        # Save the image
-        with open(output_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        # Download the image, retrying transient failures
+        logger.debug(f"Downloading image from {url} to {output_path}")
+        for attempt in range(_MAX_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(_BACKOFF_FACTOR * (2 ** (attempt - 1)))
+            
+            try:
+                async with session.get(url) as response:
+                    if response.status in _RETRY_STATUSES and attempt < _MAX_RETRIES:
+                        logger.debug(f"Got HTTP {response.status} for {url}, retrying")
+                        continue
+                    response.raise_for_status()
+                    
+                    # Stream the image to disk in large writes
+                    async with aiofiles.open(output_path, 'wb') as f:
+                        buffer = bytearray()
+                        async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                            buffer += chunk
+                            if len(buffer) >= _WRITE_BUFFER_SIZE:
+                                await f.write(buffer)
+                                buffer.clear()
+                        if buffer:
+                            await f.write(buffer)
+                break
+            
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt == _MAX_RETRIES:
+                    raise
+                logger.debug(f"Connection error for {url}, retrying: {str(e)}")
         
-        logger.info(f"Successfully downloaded image to {output_path}")
+        logger.debug(f"Successfully downloaded image to {output_path}")
         return url, output_path
         
-    except requests.RequestException as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         logger.error(f"Error downloading image from {url}: {str(e)}")
         return url, ""
     except Exception as e:
         logger.error(f"Error saving image from {url}: {str(e)}")
         return url, ""
 
+async def _download_all(tasks: List[Tuple[str, str, str, int]], max_workers: int) -> List[Any]:
+    """
+    Download a batch of images concurrently.
+    
+    Args:
+        tasks (List[Tuple[str, str, str, int]]): (url, output_dir, product_id, index) tuples
+        max_workers (int): Maximum number of concurrent downloads
+        
+    Returns:
+        List[Any]: download_image results (or raised exceptions), in task order
+    """
+    semaphore = asyncio.Semaphore(max_workers)
+    total = len(tasks)
+    completed = 0
+    
+    async with create_session(max_workers) as session:
+        async def _bounded_download(url: str, output_dir: str, product_id: str, index: int) -> Tuple[str, str]:
+            nonlocal completed
+            async with semaphore:
+                result = await download_image(session, url, output_dir, product_id, index)
+            
+            completed += 1
+            if completed % _PROGRESS_INTERVAL == 0:
+                logger.info(f"Progress: {completed}/{total} images downloaded")
+            return result
+        
+        return await asyncio.gather(
+            *[_bounded_download(*task) for task in tasks],
+            return_exceptions=True
+        )
+
 def download_product_images(products: List[Dict[str, Any]], output_dir: str, max_workers: int = 10) -> List[Dict[str, Any]]:
     """
     Download all images for a list of products.
@@ -89,46 +186,41 @@ def download_product_images(products: List[Dict[str, Any]], output_dir: str, max
     
     logger.info(f"Downloading images for {len(products)} products to {output_dir}")
     
-    # Create a list of all download tasks
-    download_tasks = []
-    for product in products:
+    # Create output directory once, rather than once per image
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Pre-size the local path slots so results can be written back by position.
+    # Identical URLs (shared logos, SKUs listed under several products) are only
+    # downloaded once; every slot that uses the URL receives the same file.
+    tasks = []
+    positions = []
+    task_by_url: Dict[str, int] = {}
+    for prod_idx, product in enumerate(products):
         product_id = product.get('product_id', 'unknown')
         image_urls = product.get('image_urls', [])
+        product['local_image_paths'] = [""] * len(image_urls)
         
-        for i, url in enumerate(image_urls):
-            download_tasks.append((url, output_dir, product_id, i))
-    
-    # Download images in parallel
-    results = {}
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_url = {
-            executor.submit(download_image, url, output_dir, product_id, i): (product_id, i, url)
-            for url, output_dir, product_id, i in download_tasks
-        }
+        for img_idx, url in enumerate(image_urls):
+            task_idx = task_by_url.get(url)
+            if task_idx is None:
+                task_idx = task_by_url[url] = len(tasks)
+                tasks.append((url, output_dir, product_id, img_idx))
+                positions.append([])
+            positions[task_idx].append((prod_idx, img_idx))
+    
+    logger.info(f"Downloading {len(tasks)} unique images")
+    
+    # Download images concurrently on a single event loop
+    results = asyncio.run(_download_all(tasks, max_workers))
+    
+    for (url, _, _, _), slots, result in zip(tasks, positions, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error processing download task for {url}: {str(result)}")
+            continue
         
-        for future in future_to_url:
-            product_id, index, url = future_to_url[future]
-            try:
-                _, local_path = future.result()
-                if local_path:
-                    if product_id not in results:
-                        results[product_id] = {}
-                    results[product_id][url] = local_path
-            except Exception as e:
-                logger.error(f"Error processing download task for {url}: {str(e)}")
-    
-    # Update products with local image paths
-    for product in products:
-        product_id = product.get('product_id', 'unknown')
-        if product_id in results:
-            image_urls = product.get('image_urls', [])
-            local_image_paths = []
-            
-            for url in image_urls:
-                local_path = results[product_id].get(url, "")
-                local_image_paths.append(local_path)
-            
-            product['local_image_paths'] = local_image_paths
+        _, local_path = result
+        for prod_idx, img_idx in slots:
+            products[prod_idx]['local_image_paths'][img_idx] = local_path
     
     logger.info(f"Finished downloading images for {len(products)} products")
-    return products
\ No newline at end of file
+    return products
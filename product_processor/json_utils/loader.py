@@ -4,12 +4,50 @@ JSON Loader Module
 This module provides functionality to load and process JSON files containing product data.
 """
 import os
+import re
 import json
 import logging
 from typing import List, Dict, Any, Union
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# orjson parses integer literals outside the 64-bit range as floats. Every
+# such literal has at least 19 digits, so files containing a run that long go
+# straight to the stdlib parser, which keeps them exact
+_WIDE_INT = re.compile(rb"\d{19,}")
+
+def _load_one(file_path: str) -> Any:
+    """
+    Read and parse a single JSON file.
+    
+    Uses orjson when it is installed and gives the same result as the stdlib
+    otherwise: inputs orjson rejects (e.g. NaN/Infinity) or would parse
+    differently (integers wider than 64 bits) are parsed by json instead.
+    
+    Args:
+        file_path (str): Path to the JSON file
+        
+    Returns:
+        Any: Parsed JSON data
+    """
+    if orjson is not None:
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        if _WIDE_INT.search(raw) is None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(raw.decode("utf-8"))
+    
+    with open(file_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
 def load_json_files(folder_path: str) -> List[Dict[str, Any]]:
     """
     Load all JSON files from the specified folder and return a list of product dictionaries.
@@ -38,18 +76,17 @@ def load_json_files(folder_path: str) -> List[Dict[str, Any]]:
                 logger.info(f"Loading JSON file: {file_path}")
                 
                 try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
+                    data = _load_one(file_path)
+                    
+                    if isinstance(data, list):
+                        logger.debug(f"Found {len(data)} products in {filename}")
+                        all_products.extend(data)
+                    elif isinstance(data, dict):
+                        logger.debug(f"Found 1 product in {filename}")
+                        all_products.append(data)
+                    else:
+                        logger.warning(f"Unexpected data type in {filename}: {type(data)}")
                         
-                        if isinstance(data, list):
-                            logger.debug(f"Found {len(data)} products in {filename}")
-                            all_products.extend(data)
-                        elif isinstance(data, dict):
-                            logger.debug(f"Found 1 product in {filename}")
-                            all_products.append(data)
-                        else:
-                            logger.warning(f"Unexpected data type in {filename}: {type(data)}")
-                            
                 except json.JSONDecodeError as e:
                     logger.error(f"Error parsing JSON file {filename}: {str(e)}")
                     raise
@@ -62,4 +99,4 @@ def load_json_files(folder_path: str) -> List[Dict[str, Any]]:
         
     except Exception as e:
         logger.error(f"Error loading JSON files: {str(e)}")
-        raise
\ No newline at end of file
+        raise
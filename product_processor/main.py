@@ -4,19 +4,123 @@ Product Processor
 This is the main entry point for the product processor application.
 It processes product data from JSON files, downloads images, and generates a CSV file.
 It can also scrape product data from websites.
+
+Only the lightweight configuration helpers are imported at module level; the
+modules for each command (and their HTTP/HTML dependencies) are imported once
+the command is known, so --help and argument errors stay fast.
 """
+import os
 import sys
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
-from product_processor.json_utils.loader import load_json_files
-from product_processor.csv_utils.generator import generate_csv
-from product_processor.image_utils.downloader import download_product_images
 from product_processor.utils.config import setup_logging, parse_args, validate_config
-from product_processor.scraper.cli import main as scraper_main
 
 logger = logging.getLogger(__name__)
 
+# Top-level help is generated from the real parser on first use and cached
+# here, keyed on everything argparse's output depends on
+_HELP_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "product_processor"
+)
+_HELP_CACHE_FILE = os.path.join(_HELP_CACHE_DIR, "help.txt")
+
+def _help_width() -> int:
+    """
+    Get the text width argparse's HelpFormatter would use.
+
+    Returns:
+        int: Usable text width in columns
+    """
+    if sys.version_info >= (3, 8):
+        import shutil
+
+        columns = shutil.get_terminal_size().columns
+    else:
+        try:
+            columns = int(os.environ["COLUMNS"])
+        except (KeyError, ValueError):
+            columns = 80
+    return columns - 2
+
+def _help_cache_key() -> Optional[str]:
+    """
+    Build the key identifying the cached top-level help.
+
+    The key covers the Python version, program name and terminal width, plus
+    the size and modification time of the module that defines the parser, so
+    editing the parser invalidates the cache.
+
+    Returns:
+        Optional[str]: Single-line cache key, or None if the help should not be
+        cached (Python 3.14+ colours argparse output depending on the terminal)
+    """
+    if sys.version_info >= (3, 14):
+        return None
+
+    from product_processor.utils import config
+
+    try:
+        stat = os.stat(config.__file__)
+    except OSError:
+        return None
+
+    prog = os.path.basename(sys.argv[0])
+    return repr((sys.version, prog, _help_width(), stat.st_size, stat.st_mtime_ns))
+
+def _read_cached_help(key: str) -> Optional[str]:
+    """
+    Read the cached top-level help.
+
+    Args:
+        key (str): Cache key of the current invocation
+
+    Returns:
+        Optional[str]: Cached help text, or None if it is missing or stale
+    """
+    try:
+        with open(_HELP_CACHE_FILE, "r", encoding="utf-8") as f:
+            cached_key, _, help_text = f.read().partition("\n")
+    except (OSError, ValueError):
+        return None
+    return help_text if cached_key == key else None
+
+def _write_cached_help(key: str, help_text: str) -> None:
+    """
+    Cache the top-level help, ignoring failures (e.g. a read-only home).
+
+    Args:
+        key (str): Cache key of the current invocation
+        help_text (str): Help text generated by the parser
+    """
+    tmp_path = f"{_HELP_CACHE_FILE}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(_HELP_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(f"{key}\n{help_text}")
+        # Replace atomically so concurrent runs never read a partial file
+        os.replace(tmp_path, _HELP_CACHE_FILE)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def _print_top_level_help() -> None:
+    """
+    Print the top-level help, building the parser only on a cache miss.
+    """
+    key = _help_cache_key()
+    help_text = _read_cached_help(key) if key is not None else None
+    if help_text is None:
+        from product_processor.utils.config import _get_parser
+
+        help_text = _get_parser(None).format_help()
+        if key is not None:
+            _write_cached_help(key, help_text)
+    sys.stdout.write(help_text)
+
 def process_products(config: Dict[str, Any]) -> None:
     """
     Process products according to the provided configuration.
@@ -24,6 +128,9 @@ def process_products(config: Dict[str, Any]) -> None:
     Args:
         config (Dict[str, Any]): Configuration dictionary
     """
+    from product_processor.json_utils.loader import load_json_files
+    from product_processor.csv_utils.generator import generate_csv
+
     try:
         # Load JSON files
         logger.info(f"Loading JSON files from {config['input_dir']}")
@@ -32,6 +139,8 @@ def process_products(config: Dict[str, Any]) -> None:
 
         # Download images if requested
         if config["download_images"]:
+            from product_processor.image_utils.downloader import download_product_images
+
             logger.info(f"Downloading images to {config['images_dir']}")
             products = download_product_images(
                 products, 
@@ -40,19 +149,13 @@ def process_products(config: Dict[str, Any]) -> None:
             )
             logger.info("Image download complete")
 
-            # Update image URLs in CSV to include local paths
+            # Update image URLs in CSV to include local paths. local_image_paths is
+            # positionally aligned with image_urls, so replace in a single pass.
             for product in products:
-                if "local_image_paths" in product:
-                    # Create a mapping of URLs to local paths
-                    image_mapping = {}
-                    for i, url in enumerate(product.get("image_urls", [])):
-                        if i < len(product["local_image_paths"]) and product["local_image_paths"][i]:
-                            image_mapping[url] = product["local_image_paths"][i]
-
-                    # Replace image_urls with local paths where available
-                    for i, url in enumerate(product.get("image_urls", [])):
-                        if url in image_mapping:
-                            product["image_urls"][i] = image_mapping[url]
+                urls = product.get("image_urls")
+                local_paths = product.get("local_image_paths")
+                if urls and local_paths:
+                    product["image_urls"] = [local_path or url for url, local_path in zip(urls, local_paths)]
 
         # Generate CSV
         logger.info(f"Generating CSV file: {config['output_csv']}")
@@ -70,6 +173,11 @@ def main() -> int:
     Returns:
         int: Exit code (0 for success, non-zero for failure)
     """
+    # Fast path for top-level help: served from the cache when possible
+    if len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help"):
+        _print_top_level_help()
+        return 0
+
     try:
         # Parse command-line arguments
         config = parse_args()
@@ -91,6 +199,8 @@ def main() -> int:
             return 0
 
         elif command == "scrape":
+            from product_processor.scraper.cli import main as scraper_main
+
             # Call the scraper main function
             return scraper_main()
 
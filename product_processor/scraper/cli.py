@@ -10,6 +10,11 @@ import argparse
 import logging
 from typing import Dict, Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from product_processor.scraper.scraper import scrape_products_from_website
 from product_processor.utils.config import setup_logging
 
@@ -161,8 +166,12 @@ def main() -> int:
         
         # Save products to JSON file
         output_path = os.path.join(config["output_dir"], config["output_file"])
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(products, f, indent=2)
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(products, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(products, f, indent=2)
         
         logger.info(f"Saved {len(products)} products to {output_path}")
         return 0
@@ -3,17 +3,26 @@ Web Scraper Module
 
 This module provides functionality to scrape product data from websites.
 """
+import asyncio
 import logging
-import requests
+import aiohttp
+import lxml.html
 from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup
+from lxml.cssselect import CSSSelector
 from urllib.parse import urljoin
 
 logger = logging.getLogger(__name__)
 
+# Number of product pages between INFO-level progress messages
+_PROGRESS_INTERVAL = 100
+
 class ProductScraper:
     """
     A class for scraping product data from websites.
+
+    Pages are fetched asynchronously with aiohttp so that product pages can be
+    downloaded concurrently instead of one after another, and are queried with
+    CSS selectors that are compiled once and reused across pages.
     """
     
     def __init__(self, base_url: str, headers: Optional[Dict[str, str]] = None):
@@ -28,42 +37,66 @@ class ProductScraper:
         self.headers = headers or {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        self._compiled: Dict[str, CSSSelector] = {}
         logger.info(f"Initialized ProductScraper for {base_url}")
     
-    def get_page(self, url: str) -> Optional[BeautifulSoup]:
+    def _compile(self, selector: str) -> CSSSelector:
+        """
+        Compile a CSS selector, reusing the compiled form on later calls.
+        
+        Args:
+            selector (str): CSS selector
+            
+        Returns:
+            CSSSelector: Compiled selector, callable on a parsed page
+        """
+        compiled = self._compiled.get(selector)
+        if compiled is None:
+            # The HTML translator matches tag names case-insensitively
+            compiled = self._compiled[selector] = CSSSelector(selector, translator='html')
+        return compiled
+    
+    async def get_page(self, session: aiohttp.ClientSession, url: str) -> Optional[lxml.html.HtmlElement]:
         """
-        Get a page and parse it with BeautifulSoup.
+        Get a page and parse it with lxml.
         
         Args:
+            session (aiohttp.ClientSession): HTTP session to fetch the page with
             url (str): The URL to fetch
             
         Returns:
-            Optional[BeautifulSoup]: Parsed HTML or None if request failed
+            Optional[lxml.html.HtmlElement]: Root of the parsed HTML or None if request failed
         """
         try:
             full_url = urljoin(self.base_url, url)
-            logger.info(f"Fetching page: {full_url}")
+            logger.debug(f"Fetching page: {full_url}")
             
-            response = requests.get(full_url, headers=self.headers, timeout=30)
-            response.raise_for_status()
+            async with session.get(full_url, headers=self.headers,
+                                   timeout=aiohttp.ClientTimeout(total=30)) as response:
+                response.raise_for_status()
+                html = await response.read()
+                # Decode with the charset from the Content-Type header (as
+                # response.text() would); lxml alone only sees <meta> tags
+                encoding = response.get_encoding()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            parser = lxml.html.HTMLParser(encoding=encoding)
+            root = lxml.html.document_fromstring(html, parser=parser)
             logger.debug(f"Successfully parsed page: {full_url}")
-            return soup
+            return root
             
-        except requests.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Error fetching page {url}: {str(e)}")
             return None
         except Exception as e:
             logger.error(f"Error parsing page {url}: {str(e)}")
             return None
     
-    def extract_product_links(self, soup: BeautifulSoup, product_link_selector: str) -> List[str]:
+    def extract_product_links(self, root: lxml.html.HtmlElement, product_link_selector: str) -> List[str]:
         """
         Extract product links from a page.
         
         Args:
-            soup (BeautifulSoup): Parsed HTML
+            root (lxml.html.HtmlElement): Root of the parsed HTML
             product_link_selector (str): CSS selector for product links
             
         Returns:
@@ -71,7 +104,7 @@ class ProductScraper:
         """
         try:
             links = []
-            for link in soup.select(product_link_selector):
+            for link in self._compile(product_link_selector)(root):
                 href = link.get('href')
                 if href:
                     full_url = urljoin(self.base_url, href)
@@ -84,12 +117,12 @@ class ProductScraper:
             logger.error(f"Error extracting product links: {str(e)}")
             return []
     
-    def extract_product_data(self, soup: BeautifulSoup, selectors: Dict[str, str]) -> Dict[str, Any]:
+    def extract_product_data(self, root: lxml.html.HtmlElement, selectors: Dict[str, str]) -> Dict[str, Any]:
         """
         Extract product data from a product page.
         
         Args:
-            soup (BeautifulSoup): Parsed HTML
+            root (lxml.html.HtmlElement): Root of the parsed HTML
             selectors (Dict[str, str]): Dictionary mapping field names to CSS selectors
             
         Returns:
@@ -99,24 +132,26 @@ class ProductScraper:
             product = {}
             
             for field, selector in selectors.items():
-                elements = soup.select(selector)
+                elements = self._compile(selector)(root)
                 if elements:
                     if field == 'image_urls':
                         # Extract multiple image URLs
                         product[field] = [img.get('src') for img in elements if img.get('src')]
                     else:
                         # Extract text for other fields
-                        product[field] = elements[0].get_text().strip()
+                        product[field] = elements[0].text_content().strip()
             
-            logger.debug(f"Extracted product data: {product}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Extracted product data: {product}")
             return product
             
         except Exception as e:
             logger.error(f"Error extracting product data: {str(e)}")
             return {}
     
-    def scrape_products(self, category_url: str, product_link_selector: str, 
-                       product_selectors: Dict[str, str], max_products: int = 100) -> List[Dict[str, Any]]:
+    async def scrape_products(self, category_url: str, product_link_selector: str, 
+                              product_selectors: Dict[str, str], max_products: int = 100,
+                              max_workers: int = 10) -> List[Dict[str, Any]]:
         """
         Scrape products from a category page.
         
@@ -125,38 +160,60 @@ class ProductScraper:
             product_link_selector (str): CSS selector for product links
             product_selectors (Dict[str, str]): Dictionary mapping field names to CSS selectors
             max_products (int, optional): Maximum number of products to scrape
+            max_workers (int, optional): Maximum number of concurrent page requests
             
         Returns:
             List[Dict[str, Any]]: List of product dictionaries
         """
         products = []
         
-        # Get the category page
-        category_soup = self.get_page(category_url)
-        if not category_soup:
-            logger.error(f"Failed to fetch category page: {category_url}")
-            return products
-        
-        # Extract product links
-        product_links = self.extract_product_links(category_soup, product_link_selector)
-        logger.info(f"Found {len(product_links)} product links")
-        
-        # Limit the number of products to scrape
-        product_links = product_links[:max_products]
-        
-        # Scrape each product page
-        for i, link in enumerate(product_links):
-            logger.info(f"Scraping product {i+1}/{len(product_links)}: {link}")
+        connector = aiohttp.TCPConnector(limit=max_workers)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            # Get the category page
+            category_root = await self.get_page(session, category_url)
+            if category_root is None:
+                logger.error(f"Failed to fetch category page: {category_url}")
+                return products
             
-            product_soup = self.get_page(link)
-            if not product_soup:
-                logger.warning(f"Failed to fetch product page: {link}")
-                continue
+            # Extract product links
+            product_links = self.extract_product_links(category_root, product_link_selector)
+            logger.info(f"Found {len(product_links)} product links")
             
-            product_data = self.extract_product_data(product_soup, product_selectors)
-            if product_data:
+            # Limit the number of products to scrape
+            product_links = product_links[:max_products]
+            
+            # Scrape product pages concurrently, bounded by the semaphore
+            semaphore = asyncio.Semaphore(max_workers)
+            total = len(product_links)
+            completed = 0
+            
+            async def _bounded_get(i: int, link: str) -> Optional[Dict[str, Any]]:
+                nonlocal completed
+                async with semaphore:
+                    logger.debug(f"Scraping product {i+1}/{total}: {link}")
+                    product_root = await self.get_page(session, link)
+                
+                completed += 1
+                if completed % _PROGRESS_INTERVAL == 0:
+                    logger.info(f"Progress: {completed}/{total} product pages fetched")
+                
+                if product_root is None:
+                    logger.warning(f"Failed to fetch product page: {link}")
+                    return None
+                
+                # Extract as soon as the page arrives so that its tree can be
+                # freed instead of being held until every page is fetched
+                product_data = self.extract_product_data(product_root, product_selectors)
+                if not product_data:
+                    return None
                 product_data['product_url'] = link
-                products.append(product_data)
+                return product_data
+            
+            results = await asyncio.gather(
+                *[_bounded_get(i, link) for i, link in enumerate(product_links)]
+            )
+        
+        products.extend(product for product in results if product is not None)
         
         logger.info(f"Successfully scraped {len(products)} products")
         return products
@@ -164,7 +221,8 @@ class ProductScraper:
 def scrape_products_from_website(base_url: str, category_url: str, 
                                product_link_selector: str, 
                                product_selectors: Dict[str, str],
-                               max_products: int = 100) -> List[Dict[str, Any]]:
+                               max_products: int = 100,
+                               max_workers: int = 10) -> List[Dict[str, Any]]:
     """
     Scrape products from a website.
     
@@ -174,9 +232,13 @@ def scrape_products_from_website(base_url: str, category_url: str,
         product_link_selector (str): CSS selector for product links
         product_selectors (Dict[str, str]): Dictionary mapping field names to CSS selectors
         max_products (int, optional): Maximum number of products to scrape
+        max_workers (int, optional): Maximum number of concurrent page requests
         
     Returns:
         List[Dict[str, Any]]: List of product dictionaries
     """
     scraper = ProductScraper(base_url)
-    return scraper.scrape_products(category_url, product_link_selector, product_selectors, max_products)
\ No newline at end of file
+    return asyncio.run(
+        scraper.scrape_products(category_url, product_link_selector, product_selectors,
+                                max_products, max_workers)
+    )
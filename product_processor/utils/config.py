@@ -2,13 +2,90 @@
 Configuration Module
 
 This module provides functionality to handle configuration settings for the product processor.
+The standard library modules it needs are imported inside the functions that
+use them, so importing this module is close to free.
 """
-import os
-import argparse
-import logging
-from typing import Dict, Any
-
-logger = logging.getLogger(__name__)
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+# Defined here rather than imported so that typing is never loaded at runtime;
+# type checkers treat a module-level TYPE_CHECKING the same as typing's
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import argparse
+    from typing import Dict, Any, List, Optional
+
+# Numeric values of the standard logging levels, hard-coded so that validating
+# a level name does not require importing logging
+_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+# Arguments of each subcommand, as (flag, add_argument keyword arguments) pairs
+_PROCESS_ARGS = [
+    ("--input-dir", {
+        "type": str,
+        "default": "rawJson",
+        "help": "Directory containing JSON files (default: rawJson)"
+    }),
+    ("--output-csv", {
+        "type": str,
+        "default": "products.csv",
+        "help": "Output CSV file path (default: products.csv)"
+    }),
+    ("--images-dir", {
+        "type": str,
+        "default": "images",
+        "help": "Directory to save downloaded images (default: images)"
+    }),
+    ("--download-images", {
+        "action": "store_true",
+        "help": "Download images from URLs"
+    }),
+    ("--max-workers", {
+        "type": int,
+        "default": 10,
+        "help": "Maximum number of concurrent image downloads (default: 10)"
+    }),
+]
+
+_SCRAPE_ARGS = [
+    ("--base-url", {
+        "type": str,
+        "required": True,
+        "help": "Base URL of the website to scrape"
+    }),
+    ("--category-url", {
+        "type": str,
+        "required": True,
+        "help": "URL of the category page to scrape"
+    }),
+    ("--product-link-selector", {
+        "type": str,
+        "required": True,
+        "help": "CSS selector for product links"
+    }),
+    ("--selectors-file", {
+        "type": str,
+        "required": True,
+        "help": "JSON file containing CSS selectors for product data"
+    }),
+    ("--output-dir", {
+        "type": str,
+        "default": "rawJson",
+        "help": "Directory to save scraped product data (default: rawJson)"
+    }),
+    ("--output-file", {
+        "type": str,
+        "default": "products.json",
+        "help": "Filename to save scraped product data (default: products.json)"
+    }),
+    ("--max-products", {
+        "type": int,
+        "default": 100,
+        "help": "Maximum number of products to scrape (default: 100)"
+    }),
+]
 
 def setup_logging(log_level: str = "INFO") -> None:
     """
@@ -17,167 +94,182 @@ def setup_logging(log_level: str = "INFO") -> None:
     Args:
         log_level (str): Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
-    numeric_level = getattr(logging, log_level.upper(), None)
-    if not isinstance(numeric_level, int):
+    numeric_level = _LEVELS.get(log_level.upper())
+    if numeric_level is None:
         raise ValueError(f"Invalid log level: {log_level}")
 
-    logging.basicConfig(
-        level=numeric_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-
-def parse_args() -> Dict[str, Any]:
+    import logging
+    from product_processor.utils.logging_handler import DeferredStreamHandler
+
+    # Configure the root logger like logging.basicConfig (a no-op if it already
+    # has handlers), but with a stream handler that is only created once the
+    # first record is emitted
+    root_logger = logging.getLogger()
+    if not root_logger.handlers:
+        root_logger.setLevel(numeric_level)
+        root_logger.addHandler(DeferredStreamHandler(
+            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        ))
+
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
     """
-    Parse command-line arguments.
+    Find the subcommand in the argument list without building a parser.
+
+    Args:
+        argv (List[str]): Command-line arguments, excluding the program name
 
     Returns:
-        Dict[str, Any]: Dictionary of parsed arguments
+        Optional[str]: First positional token, or None if there is none
     """
-    parser = argparse.ArgumentParser(description="Process product data from JSON files, download images, and scrape websites.")
-
-    # Create subparsers for different commands
-    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        if token == "--log-level":
+            # Skip the option's value as well
+            i += 2
+        elif token.startswith("-"):
+            i += 1
+        else:
+            return token
+    return None
+
+def _build_process_parser(subparsers: argparse._SubParsersAction) -> None:
+    """
+    Register the process subcommand and its arguments.
 
-    # Process command (default)
+    Args:
+        subparsers (argparse._SubParsersAction): Subparsers handle of the top-level parser
+    """
     process_parser = subparsers.add_parser("process", help="Process JSON files and generate CSV")
+    for flag, kwargs in _PROCESS_ARGS:
+        process_parser.add_argument(flag, **kwargs)
 
-    process_parser.add_argument(
-        "--input-dir",
-        type=str,
-        default="rawJson",
-        help="Directory containing JSON files (default: rawJson)"
-    )
-
-    process_parser.add_argument(
-        "--output-csv",
-        type=str,
-        default="products.csv",
-        help="Output CSV file path (default: products.csv)"
-    )
-
-    process_parser.add_argument(
-        "--images-dir",
-        type=str,
-        default="images",
-        help="Directory to save downloaded images (default: images)"
-    )
+def _build_scrape_parser(subparsers: argparse._SubParsersAction) -> None:
+    """
+    Register the scrape subcommand and its arguments.
 
-    process_parser.add_argument(
-        "--download-images",
-        action="store_true",
-        help="Download images from URLs"
-    )
+    Args:
+        subparsers (argparse._SubParsersAction): Subparsers handle of the top-level parser
+    """
+    scrape_parser = subparsers.add_parser("scrape", help="Scrape product data from websites")
+    for flag, kwargs in _SCRAPE_ARGS:
+        scrape_parser.add_argument(flag, **kwargs)
 
-    process_parser.add_argument(
-        "--max-workers",
-        type=int,
-        default=10,
-        help="Maximum number of concurrent image downloads (default: 10)"
-    )
+# Config keys holding paths that parse_args makes absolute, per command
+_ABS_KEYS_BY_COMMAND = {
+    "process": ("input_dir", "output_csv", "images_dir"),
+    "scrape": ("selectors_file", "output_dir"),
+}
 
-    # Scrape command
-    scrape_parser = subparsers.add_parser("scrape", help="Scrape product data from websites")
+def _absify(paths: Dict[str, str]) -> Dict[str, str]:
+    """
+    Make several paths absolute with at most one getcwd call.
 
-    scrape_parser.add_argument(
-        "--base-url",
-        type=str,
-        required=True,
-        help="Base URL of the website to scrape"
-    )
+    Paths that are already absolute are returned unchanged; relative ones are
+    joined to the current directory and normalized, as os.path.abspath does.
 
-    scrape_parser.add_argument(
-        "--category-url",
-        type=str,
-        required=True,
-        help="URL of the category page to scrape"
-    )
+    Args:
+        paths (Dict[str, str]): Mapping of config keys to paths
 
-    scrape_parser.add_argument(
-        "--product-link-selector",
-        type=str,
-        required=True,
-        help="CSS selector for product links"
-    )
+    Returns:
+        Dict[str, str]: The same keys mapped to absolute paths
+    """
+    import os
+
+    cwd = None
+    result = {}
+    for key, path in paths.items():
+        if not os.path.isabs(path):
+            if cwd is None:
+                cwd = os.getcwd()
+            path = os.path.normpath(os.path.join(cwd, path))
+        result[key] = path
+    return result
+
+@lru_cache(maxsize=None)
+def _get_parser(command: Optional[str]) -> argparse.ArgumentParser:
+    """
+    Build the argument parser for a command, once per process.
 
-    scrape_parser.add_argument(
-        "--selectors-file",
-        type=str,
-        required=True,
-        help="JSON file containing CSS selectors for product data"
-    )
+    The parser is not modified by parsing, so the cached instance can be
+    reused by later parse_args calls. Tests can call _get_parser.cache_clear()
+    to force a rebuild.
 
-    scrape_parser.add_argument(
-        "--output-dir",
-        type=str,
-        default="rawJson",
-        help="Directory to save scraped product data (default: rawJson)"
-    )
+    Args:
+        command (Optional[str]): "process" or "scrape" to register only that
+            subcommand, or None to register all of them
 
-    scrape_parser.add_argument(
-        "--output-file",
-        type=str,
-        default="products.json",
-        help="Filename to save scraped product data (default: products.json)"
-    )
+    Returns:
+        argparse.ArgumentParser: Fully built argument parser
+    """
+    import argparse
 
-    scrape_parser.add_argument(
-        "--max-products",
-        type=int,
-        default=100,
-        help="Maximum number of products to scrape (default: 100)"
+    # Abbreviations (e.g. --log for --log-level) are disabled so that argparse
+    # accepts exactly the options _sniff_subcommand knows how to skip
+    parser = argparse.ArgumentParser(
+        description="Process product data from JSON files, download images, and scrape websites.",
+        allow_abbrev=False
     )
 
     # Common arguments for all commands
     parser.add_argument(
         "--log-level",
         type=str,
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        choices=list(_LEVELS),
         default="INFO",
         help="Logging level (default: INFO)"
     )
 
-    args = parser.parse_args()
+    # Create subparsers for different commands
+    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+
+    if command == "process":
+        _build_process_parser(subparsers)
+    elif command == "scrape":
+        _build_scrape_parser(subparsers)
+    else:
+        # Help or an unknown command: register everything so argparse can
+        # list the available commands
+        _build_process_parser(subparsers)
+        _build_scrape_parser(subparsers)
+
+    return parser
+
+def parse_args(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Parse command-line arguments.
+
+    Only the subparser for the requested command is built; both are built
+    when no command can be identified (e.g. top-level --help).
+
+    Args:
+        argv (List[str], optional): Arguments to parse (defaults to sys.argv[1:])
+
+    Returns:
+        Dict[str, Any]: Dictionary of parsed arguments
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    command = _sniff_subcommand(argv)
 
     # If no command is specified, default to "process"
-    if not args.command:
-        args.command = "process"
-
-    # Convert args to dictionary
-    config = {
-        "command": args.command,
-        "log_level": args.log_level
-    }
-
-    # Add command-specific arguments
-    if args.command == "process":
-        config.update({
-            "input_dir": args.input_dir,
-            "output_csv": args.output_csv,
-            "images_dir": args.images_dir,
-            "download_images": args.download_images,
-            "max_workers": args.max_workers,
-        })
-
-        # Ensure paths are absolute
-        config["input_dir"] = os.path.abspath(config["input_dir"])
-        config["output_csv"] = os.path.abspath(config["output_csv"])
-        config["images_dir"] = os.path.abspath(config["images_dir"])
-
-    elif args.command == "scrape":
-        config.update({
-            "base_url": args.base_url,
-            "category_url": args.category_url,
-            "product_link_selector": args.product_link_selector,
-            "selectors_file": args.selectors_file,
-            "output_dir": args.output_dir,
-            "output_file": args.output_file,
-            "max_products": args.max_products,
-        })
-
-        # Ensure paths are absolute
-        config["selectors_file"] = os.path.abspath(config["selectors_file"])
-        config["output_dir"] = os.path.abspath(config["output_dir"])
+    if command is None and not any(arg in ("-h", "--help") for arg in argv):
+        command = "process"
+        argv = argv + ["process"]
+
+    if command not in ("process", "scrape"):
+        command = None
+
+    args = _get_parser(command).parse_args(argv)
+
+    # Convert args to dictionary; argparse dests already match the config keys
+    config = dict(vars(args))
+
+    # Ensure paths are absolute
+    abs_keys = _ABS_KEYS_BY_COMMAND.get(config["command"], ())
+    config.update(_absify({key: config[key] for key in abs_keys}))
 
     return config
 
@@ -191,6 +283,10 @@ def validate_config(config: Dict[str, Any]) -> None:
     Raises:
         ValueError: If configuration is invalid
     """
+    import logging
+    import os
+
+    logger = logging.getLogger(__name__)
     command = config.get("command", "process")
 
     if command == "process":
@@ -198,14 +294,15 @@ def validate_config(config: Dict[str, Any]) -> None:
         if not os.path.exists(config["input_dir"]):
             raise ValueError(f"Input directory does not exist: {config['input_dir']}")
 
-        # Check if input directory contains JSON files
-        json_files = [f for f in os.listdir(config["input_dir"]) if f.endswith(".json")]
-        if not json_files:
+        # Check if input directory contains JSON files, stopping at the first one
+        with os.scandir(config["input_dir"]) as entries:
+            has_json = any(entry.name.endswith(".json") and entry.is_file() for entry in entries)
+        if not has_json:
             raise ValueError(f"No JSON files found in input directory: {config['input_dir']}")
 
         # Create output directory for CSV if it doesn't exist
         output_dir = os.path.dirname(config["output_csv"])
-        if output_dir and not os.path.exists(output_dir):
+        if output_dir:
             os.makedirs(output_dir, exist_ok=True)
 
     elif command == "scrape":
@@ -214,7 +311,6 @@ def validate_config(config: Dict[str, Any]) -> None:
             raise ValueError(f"Selectors file does not exist: {config['selectors_file']}")
 
         # Create output directory if it doesn't exist
-        if not os.path.exists(config["output_dir"]):
-            os.makedirs(config["output_dir"], exist_ok=True)
+        os.makedirs(config["output_dir"], exist_ok=True)
 
-    logger.info(f"Configuration validated successfully: {config}")
+    logger.info("Configuration validated successfully: %r", config)
@@ -0,0 +1,68 @@
+"""
+Logging Handler Module
+
+This module provides a logging handler that defers creating its output stream
+and formatter until the first record is emitted.
+"""
+import logging
+from typing import Optional
+
+class DeferredStreamHandler(logging.Handler):
+    """
+    A handler that writes to stderr, creating the underlying StreamHandler and
+    its default Formatter only when the first record is emitted.
+
+    Runs that exit before logging anything (e.g. on argument errors) never pay
+    for the stream handler setup.
+    """
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None,
+                 level: int = logging.NOTSET):
+        """
+        Initialize the DeferredStreamHandler.
+
+        Args:
+            fmt (str, optional): Format string for the formatter
+            datefmt (str, optional): Date format string for the formatter
+            level (int, optional): Minimum level handled
+        """
+        super().__init__(level)
+        self._fmt = fmt
+        self._datefmt = datefmt
+        self._handler: Optional[logging.StreamHandler] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Emit a record, creating the stream handler on first use.
+
+        Records are formatted with this handler's formatter, so setFormatter
+        works as on any other handler; the formatter built from fmt/datefmt is
+        only created if none has been set. Called with the handler lock held,
+        so creation happens only once.
+
+        Args:
+            record (logging.LogRecord): Record to emit
+        """
+        if self.formatter is None:
+            self.formatter = logging.Formatter(self._fmt, self._datefmt)
+        if self._handler is None:
+            self._handler = logging.StreamHandler()
+        self._handler.formatter = self.formatter
+        self._handler.emit(record)
+
+    def flush(self) -> None:
+        """
+        Flush the underlying stream, if it has been created.
+        """
+        if self._handler is not None:
+            self._handler.flush()
+
+    def close(self) -> None:
+        """
+        Close the underlying stream handler, if it has been created.
+        """
+        try:
+            if self._handler is not None:
+                self._handler.close()
+        finally:
+            super().close()